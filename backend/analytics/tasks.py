@@ -1,7 +1,6 @@
 from celery import shared_task
 from django.utils import timezone
-from django.db.models import Count
-from issues.models import Issue
+from issues import archive
 from .models import DailyStats
 import logging
 
@@ -13,13 +12,9 @@ def aggregate_daily_stats():
     today = timezone.now().date()
     
     try:
-        # Get counts by status
-        status_counts = Issue.objects.values('status').annotate(count=Count('id'))
-        status_dict = {item['status']: item['count'] for item in status_counts}
-        
-        # Get counts by severity
-        severity_counts = Issue.objects.values('severity').annotate(count=Count('id'))
-        severity_dict = {item['severity']: item['count'] for item in severity_counts}
+        # Get counts by status and severity, archived done issues included
+        status_dict = archive.counts_by('status')
+        severity_dict = archive.counts_by('severity')
         
         # Update or create daily stats
         daily_stats, created = DailyStats.objects.update_or_create(
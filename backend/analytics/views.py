@@ -1,8 +1,7 @@
 from rest_framework import generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from django.db.models import Count
-from issues.models import Issue
+from issues import archive
 from .models import DailyStats
 from .serializers import DailyStatsSerializer
 from core.permissions import IsMaintainerOrAdmin
@@ -15,17 +14,12 @@ class DailyStatsListView(generics.ListAPIView):
 @api_view(['GET'])
 @permission_classes([IsMaintainerOrAdmin])
 def dashboard_stats(request):
-    # Current issue counts by status
-    status_counts = Issue.objects.values('status').annotate(count=Count('id'))
-    
-    # Current issue counts by severity
-    severity_counts = Issue.objects.values('severity').annotate(count=Count('id'))
-    
-    # Total issues
-    total_issues = Issue.objects.count()
+    # Archived issues are still issues; count them alongside the live table
+    status_counts = archive.counts_by('status')
+    severity_counts = archive.counts_by('severity')
     
     return Response({
-        'total_issues': total_issues,
-        'status_counts': list(status_counts),
-        'severity_counts': list(severity_counts),
+        'total_issues': sum(status_counts.values()),
+        'status_counts': [{'status': status, 'count': count} for status, count in status_counts.items()],
+        'severity_counts': [{'severity': severity, 'count': count} for severity, count in severity_counts.items()],
     })
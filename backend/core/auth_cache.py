@@ -0,0 +1,49 @@
+import hashlib
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from oauth2_provider.models import get_access_token_model
+
+USER_KEY = 'auth:user:{}'
+TOKEN_KEY = 'auth:token:{}'
+
+def _token_key(token):
+    # Never store raw bearer tokens in cache keys
+    return TOKEN_KEY.format(hashlib.sha256(token.encode()).hexdigest())
+
+def get_user(user_id):
+    """Return the user with ``user_id``, served from cache when possible"""
+    key = USER_KEY.format(user_id)
+    user = cache.get(key)
+    if user is None:
+        User = get_user_model()
+        user = User._default_manager.filter(pk=user_id).first()
+        if user is not None:
+            cache.set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+def invalidate_user(user_id):
+    cache.delete(USER_KEY.format(user_id))
+
+def get_access_token(token):
+    """Return a cached AccessToken for ``token`` without its relations, or None"""
+    data = cache.get(_token_key(token))
+    if data is None:
+        return None
+    AccessToken = get_access_token_model()
+    return AccessToken.from_db('default', list(data), list(data.values()))
+
+def set_access_token(access_token):
+    remaining = int((access_token.expires - timezone.now()).total_seconds())
+    timeout = min(settings.AUTH_TOKEN_CACHE_TIMEOUT, remaining)
+    if timeout <= 0:
+        return
+    data = {
+        field.attname: getattr(access_token, field.attname)
+        for field in access_token._meta.concrete_fields
+    }
+    cache.set(_token_key(access_token.token), data, timeout)
+
+def invalidate_access_token(token):
+    cache.delete(_token_key(token))
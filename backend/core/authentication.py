@@ -0,0 +1,27 @@
+from oauth2_provider.contrib.rest_framework import OAuth2Authentication
+from . import auth_cache
+
+class CachedOAuth2Authentication(OAuth2Authentication):
+    """OAuth2Authentication that skips the token and user queries on cache hits"""
+    
+    def authenticate(self, request):
+        token = self._get_bearer_token(request)
+        if token:
+            access_token = auth_cache.get_access_token(token)
+            if access_token is not None and access_token.is_valid():
+                user = auth_cache.get_user(access_token.user_id)
+                if user is not None:
+                    access_token.user = user
+                    return user, access_token
+        
+        result = super().authenticate(request)
+        if result is not None:
+            user, access_token = result
+            auth_cache.set_access_token(access_token)
+        return result
+    
+    def _get_bearer_token(self, request):
+        auth = request.META.get('HTTP_AUTHORIZATION', '').split()
+        if len(auth) == 2 and auth[0].lower() == 'bearer':
+            return auth[1]
+        return None
@@ -0,0 +1,9 @@
+from django.contrib.auth.backends import ModelBackend
+from . import auth_cache
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose session user lookups go through the auth cache"""
+    
+    def get_user(self, user_id):
+        user = auth_cache.get_user(user_id)
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Each profile runs in a fresh interpreter so nothing is pre-imported
+PROFILES = {
+    # Up to the first API request under daphne: ROOT_URLCONF loads on first resolve
+    'web': (
+        'issues_tracker.settings',
+        "from issues_tracker.asgi import application; from django.urls import resolve; resolve('/api/issues/')",
+    ),
+    'worker': (
+        'issues_tracker.settings_worker',
+        'from issues_tracker.celery import app; app.loader.import_default_modules()',
+    ),
+}
+
+CHILD = '''
+import json, resource, sys, time
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}}))
+'''
+
+def parse_importtime(stderr):
+    """Return [(cumulative_us, module)] from ``python -X importtime`` output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        # Nesting is shown as two spaces per level after the separator space
+        rows.append((int(cumulative), module[1:].rstrip()))
+    return rows
+
+class Command(BaseCommand):
+    help = 'Measure cold-start import time, module count and RSS of the web and worker processes'
+    # Checks would import every URLconf in this process; the children are what we measure
+    requires_system_checks = []
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', choices=list(PROFILES), action='append')
+        parser.add_argument('--runs', type=int, default=3)
+        parser.add_argument('--top', type=int, default=10, help='Slowest top-level imports to list')
+    
+    def handle(self, *args, **options):
+        for name in options['profile'] or list(PROFILES):
+            settings_module, code = PROFILES[name]
+            env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+            
+            results = []
+            for _ in range(options['runs']):
+                proc = subprocess.run(
+                    [sys.executable, '-X', 'importtime', '-c', CHILD.format(code=code)],
+                    cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+                )
+                results.append((json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr))
+            
+            best, stderr = min(results, key=lambda result: result[0]['seconds'])
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({settings_module})'))
+            self.stdout.write(f'  startup: {best["seconds"] * 1000:.0f}ms (best of {options["runs"]})')
+            self.stdout.write(f'  max RSS: {best["maxrss_kb"] / 1024:.1f}MB')
+            self.stdout.write(f'  modules: {best["modules"]}')
+            
+            # Top-level entries only: nested imports are already in their parent's total
+            top_level = [row for row in parse_importtime(stderr) if not row[1].startswith(' ')]
+            for cumulative, module in sorted(top_level, reverse=True)[:options['top']]:
+                self.stdout.write(f'  {cumulative / 1000:8.1f}ms  {module}')
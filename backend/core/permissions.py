@@ -14,7 +14,7 @@ class IsOwnerOrMaintainerOrAdmin(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.role in [User.MAINTAINER, User.ADMIN]:
             return True
-        return obj.reporter == request.user
+        return obj.reporter_id == request.user.id
 
 class IsReporterForCreate(permissions.BasePermission):
     def has_permission(self, request, view):
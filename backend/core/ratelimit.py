@@ -0,0 +1,120 @@
+import logging
+import time
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Refill and take in one round trip; uses the Redis clock so every
+# process shares the same notion of time
+TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local per_second = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * per_second)
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    retry_after = (cost - tokens) / per_second
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / per_second) + 1)
+return tostring(retry_after)
+"""
+
+# One member per open socket, scored by when it connected. Members older
+# than the TTL are pruned, so counts leaked by dead processes self-heal
+CONNECTION_SET = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1])
+local ttl = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - ttl)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[1])
+redis.call('EXPIRE', KEYS[1], ttl)
+return 1
+"""
+
+_clients = {}
+_script = None
+_connection_script = None
+_queue_depths = {}
+
+def get_client(url=None):
+    url = url or settings.RATE_LIMIT_REDIS_URL
+    if url not in _clients:
+        _clients[url] = redis.Redis.from_url(url, socket_timeout=0.5)
+    return _clients[url]
+
+def parse_rate(rate):
+    """'10/min' -> (capacity, tokens per second), as in DRF throttle rates"""
+    num, period = rate.split('/')
+    return int(num), int(num) / PERIODS[period[0]]
+
+def rate_for(scope, role):
+    rates = settings.RATE_LIMITS.get(scope, {})
+    return rates.get(role, rates.get('*'))
+
+def consume(scope, role, ident, cost=1):
+    """
+    Take ``cost`` tokens from the ``scope`` bucket of ``ident``. Returns
+    ``(allowed, retry_after_seconds)``. Fails open if Redis is unreachable.
+    """
+    global _script
+    rate = rate_for(scope, role)
+    if rate is None:
+        return True, 0.0
+    capacity, per_second = parse_rate(rate)
+    
+    try:
+        if _script is None:
+            _script = get_client().register_script(TOKEN_BUCKET)
+        retry_after = float(_script(keys=[f'ratelimit:{scope}:{ident}'], args=[capacity, per_second, cost]))
+    except redis.RedisError as e:
+        logger.warning(f'Rate limiter unavailable, allowing request: {e}')
+        return True, 0.0
+    return retry_after == 0, retry_after
+
+def acquire_connection(ident, limit, member):
+    """Count socket ``member`` as open for ``ident``; False if over ``limit``"""
+    global _connection_script
+    try:
+        if _connection_script is None:
+            _connection_script = get_client().register_script(CONNECTION_SET)
+        return bool(_connection_script(
+            keys=[f'ratelimit:ws:{ident}'], args=[member, limit, settings.WEBSOCKET_CONNECTION_TTL]
+        ))
+    except redis.RedisError as e:
+        logger.warning(f'Connection limiter unavailable, allowing socket: {e}')
+    return True
+
+def release_connection(ident, member):
+    # Removing a member that already expired is a no-op, so the count never
+    # drifts below the sockets actually open
+    try:
+        get_client().zrem(f'ratelimit:ws:{ident}', member)
+    except redis.RedisError as e:
+        logger.warning(f'Connection limiter unavailable: {e}')
+
+def queue_depth(queue):
+    """Length of a Celery queue on the Redis broker, sampled at most once a second"""
+    now = time.monotonic()
+    sampled_at, depth = _queue_depths.get(queue, (0.0, 0))
+    if now - sampled_at >= 1.0:
+        try:
+            depth = get_client(settings.CELERY_BROKER_URL).llen(queue)
+        except redis.RedisError as e:
+            logger.warning(f'Could not read depth of queue {queue}: {e}')
+            depth = 0
+        _queue_depths[queue] = (now, depth)
+    return depth
@@ -0,0 +1,25 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from oauth2_provider.models import get_access_token_model
+from . import auth_cache
+
+User = get_user_model()
+AccessToken = get_access_token_model()
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    # Role, is_active and password changes must be visible on the next
+    # request. Deleting before commit would let a concurrent request re-cache
+    # the old row, so wait for it
+    user_id = instance.pk
+    transaction.on_commit(lambda: auth_cache.invalidate_user(user_id))
+
+@receiver(post_save, sender=AccessToken)
+@receiver(post_delete, sender=AccessToken)
+def access_token_changed(sender, instance, **kwargs):
+    # AccessToken.revoke() deletes the row, so this also covers revocation
+    token = instance.token
+    transaction.on_commit(lambda: auth_cache.invalidate_access_token(token))
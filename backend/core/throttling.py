@@ -0,0 +1,24 @@
+from rest_framework.throttling import BaseThrottle
+from . import ratelimit
+
+class RoleScopedThrottle(BaseThrottle):
+    """
+    Token-bucket throttle keyed on ``view.throttle_scope`` with per-role
+    rates from settings.RATE_LIMITS. Safe methods are not throttled.
+    """
+    
+    def allow_request(self, request, view):
+        if request.method in ('GET', 'HEAD', 'OPTIONS'):
+            return True
+        
+        user = request.user
+        if user.is_authenticated:
+            role, ident = user.role, f'user:{user.pk}'
+        else:
+            role, ident = 'anonymous', f'ip:{self.get_ident(request)}'
+        
+        allowed, self.retry_after = ratelimit.consume(view.throttle_scope, role, ident)
+        return allowed
+    
+    def wait(self):
+        return self.retry_after
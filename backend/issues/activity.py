@@ -0,0 +1,25 @@
+from django.utils import timezone
+from .models import Issue, IssueActivity
+from . import http_cache
+
+TRACKED_FIELDS = ['title', 'description', 'severity', 'status', 'assignee_id', 'file_attachment']
+
+def snapshot(issue):
+    """Capture the tracked field values of ``issue`` before it is saved"""
+    values = {field: getattr(issue, field) for field in TRACKED_FIELDS}
+    values['file_attachment'] = values['file_attachment'].name or None
+    return values
+
+def diff(old, new):
+    return {field: [old[field], new[field]] for field in TRACKED_FIELDS if old[field] != new[field]}
+
+def record(issue_id, actor, verb, changes=None):
+    return record_many([IssueActivity(issue_id=issue_id, actor=actor, verb=verb, changes=changes or {})])
+
+def record_many(activities):
+    """Append activities with a single INSERT and bump last_activity_at"""
+    activities = IssueActivity.objects.bulk_create(activities)
+    issue_ids = {activity.issue_id for activity in activities}
+    Issue.objects.filter(id__in=issue_ids).update(last_activity_at=timezone.now())
+    http_cache.bump(*issue_ids)
+    return activities
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Issue, IssueTag, IssueTagAssignment, IssueComment
+from .models import (
+    Issue, IssueTag, IssueTagAssignment, IssueComment, IssueNotification,
+    IssueActivity, AssigneeLoad, ArchivedIssue
+)
 
 @admin.register(Issue)
 class IssueAdmin(admin.ModelAdmin):
@@ -18,3 +21,24 @@ class IssueCommentAdmin(admin.ModelAdmin):
     list_display = ['issue', 'author', 'created_at']
     list_filter = ['created_at']
     search_fields = ['content']
+
+@admin.register(IssueNotification)
+class IssueNotificationAdmin(admin.ModelAdmin):
+    list_display = ['issue', 'recipient', 'action', 'created_at', 'sent_at']
+    list_filter = ['action', 'sent_at']
+
+@admin.register(IssueActivity)
+class IssueActivityAdmin(admin.ModelAdmin):
+    list_display = ['issue', 'actor', 'verb', 'created_at']
+    list_filter = ['verb', 'created_at']
+
+@admin.register(AssigneeLoad)
+class AssigneeLoadAdmin(admin.ModelAdmin):
+    list_display = ['assignee', 'severity', 'open_count']
+    list_filter = ['severity']
+
+@admin.register(ArchivedIssue)
+class ArchivedIssueAdmin(admin.ModelAdmin):
+    list_display = ['title', 'severity', 'reporter', 'assignee', 'created_at', 'archived_at']
+    list_filter = ['severity', 'archived_at']
+    search_fields = ['title', 'description']
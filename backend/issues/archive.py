@@ -0,0 +1,94 @@
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+from .models import (
+    Issue, IssueComment, IssueTagAssignment, IssueNotification,
+    ArchivedIssue, ArchivedIssueComment, ArchivedIssueTagAssignment
+)
+from . import http_cache, saved_views
+
+ISSUE_FIELDS = [
+    'id', 'title', 'description', 'severity', 'status', 'reporter_id', 'assignee_id',
+    'file_attachment', 'created_at', 'updated_at', 'comment_count',
+    'last_commented_at', 'last_activity_at',
+]
+COMMENT_FIELDS = ['id', 'issue_id', 'author_id', 'content', 'created_at', 'updated_at']
+TAG_ASSIGNMENT_FIELDS = ['id', 'issue_id', 'tag_id', 'assigned_by_id', 'assigned_at']
+
+def archivable(cutoff):
+    """Done issues untouched since ``cutoff``; served by a partial index"""
+    # Comments and tag assignments only move last_activity_at. updated_at
+    # still guards edits that bypass activity recording (e.g. the admin)
+    return Issue.objects.filter(status='done', last_activity_at__lt=cutoff, updated_at__lt=cutoff)
+
+def counts_by(field):
+    """Issue counts per ``field`` value, archived issues included"""
+    counts = Counter()
+    for model in (Issue, ArchivedIssue):
+        for row in model.objects.values(field).annotate(count=Count('id')).order_by():
+            counts[row[field]] += row['count']
+    return counts
+
+def archive_batch(cutoff, batch_size):
+    """Move one batch of issues and their children to the archive tables"""
+    with transaction.atomic():
+        # Rows being edited right now are skipped and picked up next run
+        ids = list(
+            archivable(cutoff).order_by('id')
+            .select_for_update(skip_locked=True)
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        
+        ArchivedIssue.objects.bulk_create(
+            [ArchivedIssue(**row) for row in Issue.objects.filter(id__in=ids).values(*ISSUE_FIELDS)]
+        )
+        ArchivedIssueComment.objects.bulk_create(
+            [ArchivedIssueComment(**row) for row in
+             IssueComment.objects.filter(issue_id__in=ids).values(*COMMENT_FIELDS)],
+            batch_size=1000,
+        )
+        ArchivedIssueTagAssignment.objects.bulk_create(
+            [ArchivedIssueTagAssignment(**row) for row in
+             IssueTagAssignment.objects.filter(issue_id__in=ids).values(*TAG_ASSIGNMENT_FIELDS)],
+            batch_size=1000,
+        )
+        
+        # Notifications have no delete receivers, so Django issues one DELETE
+        IssueNotification.objects.filter(issue_id__in=ids).delete()
+        # Tag assignments, comments and issues have per-row delete receivers
+        # (version bumps, counters, saved views, WebSocket broadcasts) that are
+        # pointless for an archive move; http_cache.forget covers the versions
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {IssueTagAssignment._meta.db_table} WHERE issue_id = ANY(%s)', [ids]
+            )
+            cursor.execute(
+                f'DELETE FROM {IssueComment._meta.db_table} WHERE issue_id = ANY(%s)', [ids]
+            )
+            cursor.execute(f'DELETE FROM {Issue._meta.db_table} WHERE id = ANY(%s)', [ids])
+        
+        http_cache.forget(*ids)
+        saved_views.bump(
+            {'all', 'search', 'status:done'}
+            | {f'severity:{severity}' for severity in saved_views.FIELD_VALUES['severity']}
+        )
+    return len(ids)
+
+def archive_done_issues(older_than_days=None, batch_size=None, max_batches=None):
+    older_than_days = older_than_days or settings.ARCHIVE_AFTER_DAYS
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    max_batches = max_batches or settings.ARCHIVE_MAX_BATCHES
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    
+    archived = 0
+    for _ in range(max_batches):
+        moved = archive_batch(cutoff, batch_size)
+        archived += moved
+        if moved < batch_size:
+            break
+    return archived
@@ -1,12 +1,56 @@
+import ipaddress
 import json
+import time
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from core import ratelimit
 from .models import Issue
 from .serializers import IssueSerializer
 
+# Close codes in the 4000-4999 application range
+CLOSE_RATE_LIMITED = 4029
+CLOSE_SLOW_CONSUMER = 4008
+
+def _is_trusted_proxy(address):
+    try:
+        address = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES)
+
+def client_ip(scope):
+    """Peer address, or the X-Real-IP it reports if the peer is a trusted proxy"""
+    client = scope.get('client') or ('unknown',)
+    if _is_trusted_proxy(client[0]):
+        for name, value in scope.get('headers', []):
+            if name == b'x-real-ip':
+                return value.decode('latin1').strip()
+    return client[0]
+
 class IssueConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         self.room_group_name = 'issues'
+        self.connection_ident = None
+        
+        user = self.scope['user']
+        if user.is_authenticated:
+            role, ident = user.role, f'user:{user.pk}'
+        else:
+            role, ident = 'anonymous', f'ip:{client_ip(self.scope)}'
+        
+        allowed, _ = await sync_to_async(ratelimit.consume)('websocket_connect', role, ident)
+        if not allowed:
+            await self.reject(CLOSE_RATE_LIMITED)
+            return
+        
+        limit = settings.WEBSOCKET_MAX_CONNECTIONS.get(role)
+        if limit is not None:
+            if not await sync_to_async(ratelimit.acquire_connection)(ident, limit, self.channel_name):
+                await self.reject(CLOSE_RATE_LIMITED)
+                return
+            self.connection_ident = ident
         
         # Join room group
         await self.channel_layer.group_add(
@@ -16,7 +60,17 @@ class IssueConsumer(AsyncWebsocketConsumer):
         
         await self.accept()
     
+    async def reject(self, code):
+        # Closing before accept() is an HTTP 403 that carries no close code,
+        # so complete the handshake first and let the client see why
+        await self.accept()
+        await self.close(code=code)
+    
     async def disconnect(self, close_code):
+        if self.connection_ident is not None:
+            await sync_to_async(ratelimit.release_connection)(self.connection_ident, self.channel_name)
+            self.connection_ident = None
+        
         # Leave room group
         await self.channel_layer.group_discard(
             self.room_group_name,
@@ -28,6 +82,12 @@ class IssueConsumer(AsyncWebsocketConsumer):
         pass
     
     async def issue_update(self, event):
+        # A consumer this far behind cannot catch up; make the client resync
+        sent_at = event.get('sent_at')
+        if sent_at is not None and time.time() - sent_at > settings.WEBSOCKET_MAX_LAG:
+            await self.close(code=CLOSE_SLOW_CONSUMER)
+            return
+        
         # Send message to WebSocket
         await self.send(text_data=json.dumps({
             'type': 'issue_update',
@@ -0,0 +1,37 @@
+from django.db.models import Count, Exists, OuterRef, Q
+from .models import IssueTagAssignment
+from users.models import User
+
+# Query parameters shared by the issue list and saved views
+FILTER_FIELDS = ['status', 'severity', 'search']
+
+def filter_issues(queryset, user, params):
+    """Scope ``queryset`` to what ``user`` may see and apply ``params``"""
+    # Filter based on user role
+    if user.role == User.REPORTER:
+        queryset = queryset.filter(reporter=user)
+    
+    status_filter = params.get('status')
+    severity_filter = params.get('severity')
+    search = params.get('search')
+    
+    if status_filter:
+        queryset = queryset.filter(status=status_filter)
+    if severity_filter:
+        queryset = queryset.filter(severity=severity_filter)
+    if search:
+        queryset = queryset.filter(
+            Q(title__icontains=search) | Q(description__icontains=search)
+        )
+    
+    return queryset
+
+def filter_by_tags(queryset, tag_ids, match='any'):
+    """Issues carrying any (or all) of ``tag_ids``, via the (tag, issue) index"""
+    assignments = IssueTagAssignment.objects.filter(tag_id__in=tag_ids)
+    if match == 'all':
+        tagged = assignments.values('issue_id').annotate(
+            matched=Count('tag_id')
+        ).filter(matched=len(set(tag_ids))).values('issue_id')
+        return queryset.filter(id__in=tagged)
+    return queryset.filter(Exists(assignments.filter(issue_id=OuterRef('id'))))
@@ -0,0 +1,85 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from .models import Issue
+from .tag_catalog import catalog
+
+VERSION_KEY = 'issue:{}:version'
+REPRESENTATION_KEY = 'issue:{}:{}:{}'
+USERS_VERSION_KEY = 'users:version'
+
+def get_version(issue_id):
+    """
+    Version stamp (ns timestamp) of everything rendered for an issue, or
+    None if the issue does not exist. Bumped on issue, comment and tag
+    assignment writes; rebuilt from the row's timestamps after eviction.
+    """
+    version = cache.get(VERSION_KEY.format(issue_id))
+    if version is None:
+        row = Issue.objects.filter(id=issue_id).values_list(
+            'updated_at', 'last_activity_at', 'last_commented_at'
+        ).first()
+        if row is None:
+            return None
+        version = int(max(value for value in row if value is not None).timestamp() * 1e9)
+        cache.add(VERSION_KEY.format(issue_id), version, None)
+    return version
+
+def bump(*issue_ids):
+    def write():
+        version = time.time_ns()
+        cache.set_many({VERSION_KEY.format(issue_id): version for issue_id in issue_ids}, None)
+    transaction.on_commit(write)
+
+def forget(*issue_ids):
+    transaction.on_commit(lambda: cache.delete_many([VERSION_KEY.format(issue_id) for issue_id in issue_ids]))
+
+def users_version():
+    """
+    Version stamp of the user data embedded in issue payloads. One stamp
+    for all users: profile edits are rare and every issue may embed anyone.
+    """
+    version = cache.get(USERS_VERSION_KEY)
+    if version is None:
+        cache.add(USERS_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(USERS_VERSION_KEY)
+    return version
+
+def bump_users():
+    transaction.on_commit(lambda: cache.set(USERS_VERSION_KEY, time.time_ns(), None))
+
+class Validators:
+    """ETag/Last-Modified for one representation of an issue"""
+    
+    def __init__(self, request, issue_id, kind, version):
+        self.issue_id = issue_id
+        # Embedded reporter/assignee/author data changes without touching
+        # the issue, so a user edit has to move Last-Modified as well
+        version = max(version, users_version())
+        # Tag names/colors and absolute file URLs are part of the payload too
+        variant = f'{kind}:{catalog.version()}:{request.get_host()}:{request.META.get("QUERY_STRING", "")}'
+        digest = hashlib.sha1(variant.encode()).hexdigest()[:16]
+        self.etag = f'"{issue_id}-{version}-{digest}"'
+        self.last_modified = version // 10**9
+        self.key = REPRESENTATION_KEY.format(issue_id, version, digest)
+    
+    def not_modified(self, request):
+        """A 304 response if the client's copy is current, else None"""
+        return get_conditional_response(request, etag=self.etag, last_modified=self.last_modified)
+    
+    def get(self):
+        return cache.get(self.key)
+    
+    def set(self, entry):
+        cache.set(self.key, entry, settings.ISSUE_REPRESENTATION_CACHE_TIMEOUT)
+    
+    def decorate(self, response):
+        response['ETag'] = self.etag
+        response['Last-Modified'] = http_date(self.last_modified)
+        # Let browsers keep the body but revalidate on every poll
+        response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -0,0 +1,57 @@
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from issues.models import Issue
+from issues import workload
+from users.models import User
+
+class Command(BaseCommand):
+    help = 'Create a burst of concurrent auto-assigned issues and report latency and balance'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--issues', type=int, default=200)
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--severity', default='critical')
+        parser.add_argument('--keep', action='store_true', help='Keep the created issues')
+    
+    def handle(self, *args, **options):
+        reporter = User.objects.order_by('id').first()
+        if reporter is None or not User.objects.filter(role=User.MAINTAINER, is_active=True).exists():
+            raise CommandError('Need at least one user and one active maintainer')
+        severity = options['severity']
+        
+        def create(n):
+            started = time.monotonic()
+            try:
+                with transaction.atomic():
+                    issue = Issue.objects.create(
+                        title=f'bench auto-assign {n}',
+                        description='Created by bench_auto_assign',
+                        severity=severity,
+                        reporter=reporter,
+                        assignee_id=workload.pick_assignee(severity),
+                    )
+                return issue.id, issue.assignee_id, time.monotonic() - started
+            finally:
+                connection.close()
+        
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            results = list(pool.map(create, range(options['issues'])))
+        elapsed = time.monotonic() - started
+        
+        latencies = sorted(latency * 1000 for _, _, latency in results)
+        balance = Counter(assignee_id for _, assignee_id, _ in results)
+        self.stdout.write(f'issues:      {len(results)} at concurrency {options["concurrency"]}')
+        self.stdout.write(f'throughput:  {len(results) / elapsed:.1f} creates/sec')
+        self.stdout.write(f'latency:     p50={statistics.median(latencies):.1f}ms '
+                          f'p95={latencies[int(len(latencies) * 0.95) - 1]:.1f}ms '
+                          f'max={latencies[-1]:.1f}ms')
+        self.stdout.write(f'assignments: {dict(balance)}')
+        
+        if not options['keep']:
+            for issue in Issue.objects.filter(id__in=[issue_id for issue_id, _, _ in results]):
+                issue.delete()
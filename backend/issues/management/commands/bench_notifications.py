@@ -0,0 +1,64 @@
+import time
+import uuid
+from datetime import timezone as dt_timezone
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from issues.models import Issue
+from issues.tasks import send_issue_notification
+from users.models import User
+
+class Command(BaseCommand):
+    help = ('Measure notification fan-out throughput and latency against a running worker '
+            '(publish to queued rows; digest delivery is not included)')
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=200)
+        parser.add_argument('--timeout', type=float, default=120.0)
+        parser.add_argument('--keep', action='store_true', help='Keep the throwaway issue, user and notifications')
+    
+    def handle(self, *args, **options):
+        # A throwaway reporter on an unassigned issue is the only recipient,
+        # so no real user gets benchmark lines in their next digest
+        run = uuid.uuid4().hex[:12]
+        recipient = User.objects.create_user(
+            username=f'bench-notify-{run}',
+            email=f'bench-notify-{run}@example.invalid',
+            password=None,
+            is_active=False,
+        )
+        issue = Issue.objects.create(
+            title=f'bench notifications {run}',
+            description='Created by bench_notifications',
+            reporter=recipient,
+        )
+        
+        try:
+            count = options['tasks']
+            started = time.monotonic()
+            sent = []
+            for n in range(count):
+                sent.append((timezone.now(), send_issue_notification.delay(
+                    issue.id, 'status_changed', f'bench:{run}:{n}', issue.status
+                )))
+            
+            for _, result in sent:
+                result.get(timeout=options['timeout'])
+            elapsed = time.monotonic() - started
+        finally:
+            if not options['keep']:
+                # Cascades to the issue and its notifications
+                recipient.delete()
+        
+        latencies = []
+        for sent_at, result in sent:
+            done = result.date_done
+            if timezone.is_naive(done):
+                done = timezone.make_aware(done, dt_timezone.utc)
+            latencies.append((done - sent_at).total_seconds() * 1000)
+        latencies.sort()
+        
+        self.stdout.write(f'tasks:      {count}')
+        self.stdout.write(f'throughput: {count / elapsed:.1f} tasks/sec')
+        self.stdout.write(f'fan-out:    p50={latencies[len(latencies) // 2]:.1f}ms '
+                          f'p95={latencies[int(len(latencies) * 0.95) - 1]:.1f}ms '
+                          f'max={latencies[-1]:.1f}ms')
@@ -0,0 +1,57 @@
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.test import APIClient
+from issues.models import Issue
+from users.models import User
+
+class Command(BaseCommand):
+    help = 'Hammer the issue create endpoint as one user and report status codes and latency'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('email', help='User to send the requests as')
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--keep', action='store_true', help='Keep the created issues')
+    
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options['email'])
+        except User.DoesNotExist:
+            raise CommandError(f'No user with email {options["email"]}')
+        
+        def post(n):
+            client = APIClient()
+            client.force_authenticate(user=user)
+            started = time.monotonic()
+            try:
+                response = client.post('/api/issues/', {
+                    'title': f'bench write load {n}',
+                    'description': 'Created by bench_write_load',
+                    'severity': 'low',
+                })
+                return response.status_code, (time.monotonic() - started) * 1000
+            finally:
+                connection.close()
+        
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            results = list(pool.map(post, range(options['requests'])))
+        elapsed = time.monotonic() - started
+        
+        self.stdout.write(f'requests: {len(results)} at concurrency {options["concurrency"]} '
+                          f'in {elapsed:.1f}s as {user.role}')
+        self.stdout.write(f'statuses: {dict(Counter(status for status, _ in results))}')
+        for status in sorted({status for status, _ in results}):
+            latencies = sorted(latency for code, latency in results if code == status)
+            self.stdout.write(f'  {status}: p50={statistics.median(latencies):.1f}ms '
+                              f'p95={latencies[max(int(len(latencies) * 0.95) - 1, 0)]:.1f}ms '
+                              f'p99={latencies[max(int(len(latencies) * 0.99) - 1, 0)]:.1f}ms '
+                              f'max={latencies[-1]:.1f}ms')
+        
+        if not options['keep']:
+            for issue in Issue.objects.filter(reporter=user, title__startswith='bench write load '):
+                issue.delete()
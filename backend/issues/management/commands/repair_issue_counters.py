@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db import transaction
+from issues.models import Issue, IssueComment, IssueActivity, AssigneeLoad
+from users.models import User
+
+class Command(BaseCommand):
+    help = 'Recompute denormalized issue counters and per-assignee workload'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+    
+    def handle(self, *args, **options):
+        comments = IssueComment.objects.filter(issue_id=OuterRef('id')).order_by()
+        comment_count = comments.values('issue_id').annotate(count=Count('id')).values('count')
+        last_commented = comments.order_by('-created_at').values('created_at')[:1]
+        last_activity = IssueActivity.objects.filter(
+            issue_id=OuterRef('id')
+        ).order_by('-id').values('created_at')[:1]
+        
+        batch_size = options['batch_size']
+        last_id = 0
+        repaired = 0
+        while True:
+            ids = list(
+                Issue.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            
+            # GREATEST ignores NULLs on PostgreSQL
+            repaired += Issue.objects.filter(id__in=ids).update(
+                comment_count=Coalesce(Subquery(comment_count), Value(0)),
+                last_commented_at=Subquery(last_commented),
+                last_activity_at=Greatest(
+                    F('updated_at'), Subquery(last_commented), Subquery(last_activity)
+                ),
+            )
+            last_id = ids[-1]
+        
+        self.stdout.write(self.style.SUCCESS(f'Repaired counters on {repaired} issues'))
+        
+        loads = (
+            Issue.objects.filter(assignee__isnull=False)
+            .exclude(status='done')
+            .values('assignee_id', 'severity')
+            .annotate(open_count=Count('id'))
+            .order_by()
+        )
+        with transaction.atomic():
+            AssigneeLoad.objects.update(open_count=0)
+            # Idle maintainers need zero rows too, or auto-assign never picks them
+            AssigneeLoad.objects.bulk_create(
+                [
+                    AssigneeLoad(assignee_id=user_id, severity=severity)
+                    for user_id in User.objects.filter(
+                        role=User.MAINTAINER, is_active=True
+                    ).values_list('id', flat=True)
+                    for severity, _ in Issue.SEVERITY_CHOICES
+                ],
+                ignore_conflicts=True,
+            )
+            AssigneeLoad.objects.bulk_create(
+                [AssigneeLoad(**load) for load in loads],
+                update_conflicts=True,
+                unique_fields=['assignee', 'severity'],
+                update_fields=['open_count'],
+            )
+        
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(loads)} workload counters'))
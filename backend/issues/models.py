@@ -1,5 +1,7 @@
 from django.db import models
+from django.contrib.postgres.indexes import BrinIndex
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 import os
 
 User = get_user_model()
@@ -32,11 +34,52 @@ class Issue(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Denormalized; maintained by issues.signals and issues.activity
+    DENORMALIZED_FIELDS = {'comment_count', 'last_commented_at', 'last_activity_at'}
+    comment_count = models.PositiveIntegerField(default=0)
+    last_commented_at = models.DateTimeField(null=True, blank=True)
+    last_activity_at = models.DateTimeField(default=timezone.now)
+    
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-last_activity_at', '-id'], name='issue_last_activity'),
+            models.Index(fields=['-comment_count', '-id'], name='issue_comment_count'),
+            models.Index(
+                fields=['assignee', '-created_at'],
+                name='issue_open_by_assignee',
+                condition=~models.Q(status='done'),
+            ),
+            models.Index(
+                fields=['last_activity_at'],
+                name='issue_done_by_activity',
+                condition=models.Q(status='done'),
+            ),
+        ]
     
     def __str__(self):
         return self.title
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets post_save handlers see which filtered fields actually changed
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+    
+    def save(self, *args, **kwargs):
+        # Counters are written with F() updates; a full save of a stale
+        # instance must not overwrite them
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+        # post_save handlers have seen the old values; track the new ones
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname) for field in self._meta.concrete_fields
+        }
 
 class IssueTag(models.Model):
     name = models.CharField(max_length=50, unique=True)
@@ -54,6 +97,9 @@ class IssueTagAssignment(models.Model):
     
     class Meta:
         unique_together = ['issue', 'tag']
+        indexes = [
+            models.Index(fields=['tag', 'issue'], name='tag_assignment_by_tag'),
+        ]
 
 class IssueComment(models.Model):
     issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name='comments')
@@ -67,3 +113,133 @@ class IssueComment(models.Model):
     
     def __str__(self):
         return f'Comment by {self.author.email} on {self.issue.title}'
+
+class IssueNotification(models.Model):
+    issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name='notifications')
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='issue_notifications')
+    action = models.CharField(max_length=20)
+    # Status the published change moved the issue to, not its current one
+    status = models.CharField(max_length=20, choices=Issue.STATUS_CHOICES, blank=True)
+    idempotency_key = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        unique_together = ['recipient', 'idempotency_key']
+        indexes = [
+            models.Index(
+                fields=['created_at'],
+                name='issue_notification_pending',
+                condition=models.Q(sent_at__isnull=True),
+            ),
+        ]
+    
+    def __str__(self):
+        return f'{self.action} notification for {self.recipient_id} on issue {self.issue_id}'
+
+class IssueActivity(models.Model):
+    ISSUE_CREATED = 'issue_created'
+    ISSUE_UPDATED = 'issue_updated'
+    TAG_ASSIGNED = 'tag_assigned'
+    COMMENT_ADDED = 'comment_added'
+    
+    VERB_CHOICES = [
+        (ISSUE_CREATED, 'Issue created'),
+        (ISSUE_UPDATED, 'Issue updated'),
+        (TAG_ASSIGNED, 'Tag assigned'),
+        (COMMENT_ADDED, 'Comment added'),
+    ]
+    
+    # No FK constraint: history outlives archived and deleted issues
+    issue = models.ForeignKey(
+        Issue, on_delete=models.DO_NOTHING, db_constraint=False, related_name='activities'
+    )
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    verb = models.CharField(max_length=20, choices=VERB_CHOICES)
+    # Field-level diff: {field: [old, new]}, or event details for tags/comments
+    changes = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['issue', '-id'], name='issue_activity_timeline'),
+            BrinIndex(fields=['created_at'], name='issue_activity_created_brin'),
+        ]
+    
+    def __str__(self):
+        return f'{self.verb} on issue {self.issue_id}'
+
+class SavedView(models.Model):
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_views')
+    name = models.CharField(max_length=100)
+    # Same keys as the issue list query parameters: status, severity, search
+    filters = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['name']
+        unique_together = ['owner', 'name']
+    
+    def __str__(self):
+        return self.name
+
+class AssigneeLoad(models.Model):
+    """Open (not done) issues per assignee and severity, maintained by issues.workload"""
+    assignee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='workload')
+    severity = models.CharField(max_length=20, choices=Issue.SEVERITY_CHOICES)
+    open_count = models.IntegerField(default=0)
+    
+    class Meta:
+        unique_together = ['assignee', 'severity']
+        indexes = [
+            models.Index(fields=['severity', 'open_count'], name='assignee_load_least_loaded'),
+        ]
+    
+    def __str__(self):
+        return f'{self.assignee_id}: {self.open_count} open {self.severity}'
+
+class ArchivedIssue(models.Model):
+    """Done issues moved out of the hot table by issues.archive; ids are preserved"""
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    severity = models.CharField(max_length=20, choices=Issue.SEVERITY_CHOICES)
+    status = models.CharField(max_length=20, choices=Issue.STATUS_CHOICES)
+    reporter = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    assignee = models.ForeignKey(
+        User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+'
+    )
+    file_attachment = models.FileField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    comment_count = models.PositiveIntegerField(default=0)
+    last_commented_at = models.DateTimeField(null=True, blank=True)
+    last_activity_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return self.title
+
+class ArchivedIssueComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    issue = models.ForeignKey(ArchivedIssue, on_delete=models.CASCADE, related_name='comments')
+    author = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    content = models.TextField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    
+    class Meta:
+        ordering = ['created_at']
+
+class ArchivedIssueTagAssignment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    issue = models.ForeignKey(ArchivedIssue, on_delete=models.CASCADE, related_name='tag_assignments')
+    tag = models.ForeignKey(IssueTag, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    assigned_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    assigned_at = models.DateTimeField()
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+class ActivityCursorPagination(CursorPagination):
+    # Keyset pagination on the primary key: no OFFSET scans and no COUNT query
+    ordering = '-id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+class QueueCursorPagination(CursorPagination):
+    # Walks the partial (assignee, -created_at) index without a COUNT query
+    ordering = '-created_at'
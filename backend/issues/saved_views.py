@@ -0,0 +1,114 @@
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from .filters import filter_issues
+from .models import Issue
+
+RESULT_KEY = 'saved_view:{}'
+GENERATION_KEY = 'saved_view:gen:{}'
+FIELD_VALUES = {
+    'status': [value for value, _ in Issue.STATUS_CHOICES],
+    'severity': [value for value, _ in Issue.SEVERITY_CHOICES],
+}
+
+def dependency_keys(filters):
+    """Generation keys whose bump may change which issues match ``filters``"""
+    keys = [f'{field}:{filters[field]}' for field in FIELD_VALUES if filters.get(field)]
+    if filters.get('search'):
+        keys.append('search')
+    return sorted(keys) or ['all']
+
+def changed_keys(issue, created=False, deleted=False):
+    """Generation keys affected by writing ``issue``"""
+    if created or deleted:
+        return {'all', 'search', f'status:{issue.status}', f'severity:{issue.severity}'}
+    
+    loaded = getattr(issue, '_loaded_values', {})
+    keys = set()
+    for field, values in FIELD_VALUES.items():
+        new = getattr(issue, field)
+        if field not in loaded:
+            # Old value unknown; every view filtering on this field may be stale
+            keys.update(f'{field}:{value}' for value in values)
+        elif loaded[field] != new:
+            keys.update({f'{field}:{loaded[field]}', f'{field}:{new}'})
+    if any(loaded.get(field, object()) != getattr(issue, field) for field in ('title', 'description')):
+        keys.add('search')
+    return keys
+
+def issue_changed(issue, created=False, deleted=False):
+    bump(changed_keys(issue, created=created, deleted=deleted))
+
+def bump(keys):
+    if keys:
+        # Bump only after commit so a concurrent reader cannot cache pre-commit rows
+        generation = time.time_ns()
+        transaction.on_commit(lambda: cache.set_many(
+            {GENERATION_KEY.format(key): generation for key in keys}, None
+        ))
+
+def invalidate(view_id):
+    cache.delete(RESULT_KEY.format(view_id))
+
+def get_results(view, user):
+    """
+    Return the cached result entry for ``view``, recomputing it if any of
+    its dependency generations moved since it was stored.
+    """
+    key = RESULT_KEY.format(view.id)
+    generation_keys = [GENERATION_KEY.format(dep) for dep in dependency_keys(view.filters)]
+    cached = cache.get_many([key] + generation_keys)
+    generations = {dep: cached.get(dep, 0) for dep in generation_keys}
+    
+    entry = cached.get(key)
+    if entry is not None and entry['generations'] == generations:
+        return entry
+    
+    # Generations are read before querying, so a write that lands mid-query
+    # leaves this entry stale rather than wrongly fresh
+    queryset = filter_issues(Issue.objects.all(), user, view.filters)
+    limit = settings.SAVED_VIEW_MAX_RESULTS
+    ids = list(queryset.values_list('id', flat=True)[:limit])
+    count = len(ids) if len(ids) < limit else queryset.count()
+    
+    fresh = {
+        'ids': ids,
+        'count': count,
+        'computed_at': timezone.now(),
+        'generations': generations,
+        'previous_computed_at': None,
+        'added': [],
+        'removed': [],
+    }
+    if entry is not None:
+        old_ids, new_ids = set(entry['ids']), set(ids)
+        fresh['previous_computed_at'] = entry['computed_at']
+        fresh['added'] = [issue_id for issue_id in ids if issue_id not in old_ids]
+        fresh['removed'] = [issue_id for issue_id in entry['ids'] if issue_id not in new_ids]
+    
+    cache.set(key, fresh, settings.SAVED_VIEW_CACHE_TIMEOUT)
+    return fresh
+
+def page_ids(entry, view, user, start, stop):
+    """Ids for ``[start:stop]``; pages beyond the cached prefix are queried live"""
+    if stop <= len(entry['ids']) or len(entry['ids']) >= entry['count']:
+        return entry['ids'][start:stop]
+    queryset = filter_issues(Issue.objects.all(), user, view.filters)
+    return list(queryset.values_list('id', flat=True)[start:stop])
+
+def changes_since(entry, since):
+    """Delta of ``entry`` relative to a client that last synced at ``since``"""
+    if since >= entry['computed_at']:
+        added, removed = [], []
+    elif entry['previous_computed_at'] is not None and since >= entry['previous_computed_at']:
+        added, removed = entry['added'], entry['removed']
+    else:
+        return {'full_refresh': True}
+    
+    updated = list(
+        Issue.objects.filter(id__in=entry['ids'], last_activity_at__gt=since)
+        .values_list('id', flat=True)
+    )
+    return {'full_refresh': False, 'added': added, 'removed': removed, 'updated': updated}
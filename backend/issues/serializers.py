@@ -1,5 +1,10 @@
 from rest_framework import serializers
-from .models import Issue, IssueTag, IssueTagAssignment, IssueComment
+from .models import (
+    Issue, IssueTag, IssueTagAssignment, IssueComment, IssueActivity, SavedView,
+    ArchivedIssue, ArchivedIssueComment, ArchivedIssueTagAssignment
+)
+from .filters import FILTER_FIELDS
+from .tag_catalog import catalog
 from users.serializers import UserSerializer
 
 class IssueTagSerializer(serializers.ModelSerializer):
@@ -8,12 +13,17 @@ class IssueTagSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'color', 'created_at']
 
 class IssueTagAssignmentSerializer(serializers.ModelSerializer):
-    tag = IssueTagSerializer(read_only=True)
+    tag = serializers.SerializerMethodField()
     assigned_by = UserSerializer(read_only=True)
     
     class Meta:
         model = IssueTagAssignment
         fields = ['id', 'tag', 'assigned_by', 'assigned_at']
+    
+    def get_tag(self, obj):
+        # Served from the in-process catalog instead of a per-row query
+        tag = catalog.get(obj.tag_id)
+        return IssueTagSerializer(tag).data if tag is not None else None
 
 class IssueCommentSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
@@ -23,6 +33,13 @@ class IssueCommentSerializer(serializers.ModelSerializer):
         fields = ['id', 'content', 'author', 'created_at', 'updated_at']
         read_only_fields = ['id', 'author', 'created_at', 'updated_at']
 
+class IssueActivitySerializer(serializers.ModelSerializer):
+    actor = UserSerializer(read_only=True)
+    
+    class Meta:
+        model = IssueActivity
+        fields = ['id', 'issue', 'actor', 'verb', 'changes', 'created_at']
+
 class IssueSerializer(serializers.ModelSerializer):
     reporter = UserSerializer(read_only=True)
     assignee = UserSerializer(read_only=True)
@@ -35,9 +52,13 @@ class IssueSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'severity', 'status',
             'reporter', 'assignee', 'file_attachment', 'file_url',
-            'tag_assignments', 'comments', 'created_at', 'updated_at'
+            'tag_assignments', 'comments', 'comment_count', 'last_commented_at',
+            'last_activity_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'id', 'reporter', 'comment_count', 'last_commented_at',
+            'last_activity_at', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'reporter', 'created_at', 'updated_at']
     
     def get_file_url(self, obj):
         if obj.file_attachment:
@@ -54,3 +75,52 @@ class IssueCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data['reporter'] = self.context['request'].user
         return super().create(validated_data)
+
+class SavedViewSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedView
+        fields = ['id', 'name', 'filters', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
+    
+    def validate_name(self, value):
+        queryset = SavedView.objects.filter(owner=self.context['request'].user, name=value)
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError('You already have a view with this name.')
+        return value
+    
+    def validate_filters(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError('Expected an object.')
+        unknown = set(value) - set(FILTER_FIELDS)
+        if unknown:
+            raise serializers.ValidationError(f'Unknown filters: {", ".join(sorted(unknown))}.')
+        choices = {'status': Issue.STATUS_CHOICES, 'severity': Issue.SEVERITY_CHOICES}
+        for field, field_choices in choices.items():
+            if not value.get(field):
+                continue
+            if not isinstance(value[field], str):
+                raise serializers.ValidationError(f'{field} must be a string.')
+            if value[field] not in dict(field_choices):
+                raise serializers.ValidationError(f'Invalid {field}: {value[field]}.')
+        if not isinstance(value.get('search', ''), str):
+            raise serializers.ValidationError('search must be a string.')
+        return value
+
+class ArchivedIssueTagAssignmentSerializer(IssueTagAssignmentSerializer):
+    class Meta(IssueTagAssignmentSerializer.Meta):
+        model = ArchivedIssueTagAssignment
+
+class ArchivedIssueCommentSerializer(IssueCommentSerializer):
+    class Meta(IssueCommentSerializer.Meta):
+        model = ArchivedIssueComment
+
+class ArchivedIssueSerializer(IssueSerializer):
+    tag_assignments = ArchivedIssueTagAssignmentSerializer(many=True, read_only=True)
+    comments = ArchivedIssueCommentSerializer(many=True, read_only=True)
+    
+    class Meta(IssueSerializer.Meta):
+        model = ArchivedIssue
+        fields = IssueSerializer.Meta.fields + ['archived_at']
+        read_only_fields = fields
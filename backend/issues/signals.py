@@ -1,12 +1,28 @@
+import logging
+import time
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
-from .models import Issue
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from .models import Issue, IssueComment, IssueTag, IssueTagAssignment
 from .serializers import IssueSerializer
+from users.models import User
+from core import ratelimit
+from . import http_cache, saved_views, tag_catalog, workload
+
+logger = logging.getLogger(__name__)
 
 @receiver(post_save, sender=Issue)
 def issue_saved(sender, instance, created, **kwargs):
+    # Under a write storm, shed updates rather than flood every socket;
+    # clients refetch on reconnect or their next poll
+    allowed, _ = ratelimit.consume('broadcast', None, 'issues')
+    if not allowed:
+        logger.warning(f'Shedding broadcast for issue {instance.id}')
+        return
+    
     channel_layer = get_channel_layer()
     serializer = IssueSerializer(instance)
     
@@ -14,6 +30,7 @@ def issue_saved(sender, instance, created, **kwargs):
         'issues',
         {
             'type': 'issue_update',
+            'sent_at': time.time(),
             'data': {
                 'action': 'created' if created else 'updated',
                 'issue': serializer.data
@@ -29,9 +46,82 @@ def issue_deleted(sender, instance, **kwargs):
         'issues',
         {
             'type': 'issue_update',
+            'sent_at': time.time(),
             'data': {
                 'action': 'deleted',
                 'issue_id': instance.id
             }
         }
     )
+
+@receiver(post_save, sender=Issue)
+def invalidate_saved_views(sender, instance, created, **kwargs):
+    saved_views.issue_changed(instance, created=created)
+
+@receiver(post_delete, sender=Issue)
+def invalidate_saved_views_on_delete(sender, instance, **kwargs):
+    saved_views.issue_changed(instance, deleted=True)
+
+@receiver(post_save, sender=Issue)
+def update_workload(sender, instance, created, **kwargs):
+    workload.issue_written(instance, created=created)
+
+@receiver(post_delete, sender=Issue)
+def update_workload_on_delete(sender, instance, **kwargs):
+    workload.issue_written(instance, deleted=True)
+
+@receiver(post_save, sender=User)
+def ensure_workload_counters(sender, instance, **kwargs):
+    workload.ensure_counters(instance)
+
+@receiver(post_save, sender=IssueComment)
+def comment_saved(sender, instance, created, **kwargs):
+    if created:
+        Issue.objects.filter(id=instance.issue_id).update(
+            comment_count=F('comment_count') + 1,
+            # Concurrent commits may land out of order; never move backwards
+            last_commented_at=Greatest(
+                Coalesce(F('last_commented_at'), Value(instance.created_at)),
+                Value(instance.created_at),
+            ),
+        )
+
+@receiver(post_delete, sender=IssueComment)
+def comment_deleted(sender, instance, **kwargs):
+    latest = IssueComment.objects.filter(
+        issue_id=OuterRef('id')
+    ).order_by('-created_at').values('created_at')[:1]
+    
+    Issue.objects.filter(id=instance.issue_id).update(
+        comment_count=Greatest(F('comment_count') - 1, 0),
+        last_commented_at=Subquery(latest),
+    )
+
+@receiver(post_save, sender=IssueTag)
+@receiver(post_delete, sender=IssueTag)
+def invalidate_tag_catalog(sender, instance, **kwargs):
+    tag_catalog.invalidate()
+
+# Connected last so the version bump follows the counter updates above
+@receiver(post_save, sender=Issue)
+def bump_issue_version(sender, instance, **kwargs):
+    http_cache.bump(instance.id)
+
+@receiver(post_delete, sender=Issue)
+def forget_issue_version(sender, instance, **kwargs):
+    http_cache.forget(instance.id)
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def bump_users_version(sender, instance, update_fields=None, **kwargs):
+    # Logins only touch last_login, which issue payloads don't embed
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    http_cache.bump_users()
+
+@receiver(post_save, sender=IssueComment)
+@receiver(post_delete, sender=IssueComment)
+@receiver(post_save, sender=IssueTagAssignment)
+@receiver(post_delete, sender=IssueTagAssignment)
+def bump_parent_issue_version(sender, instance, **kwargs):
+    http_cache.bump(instance.issue_id)
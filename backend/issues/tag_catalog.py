@@ -0,0 +1,66 @@
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from .models import IssueTag
+
+VERSION_KEY = 'tag_catalog:version'
+
+class TagCatalog:
+    """
+    Process-local copy of all IssueTags. A version stamp in the shared cache
+    is checked at most every TAG_CATALOG_CHECK_INTERVAL seconds; when it has
+    moved, the catalog reloads in one query.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tags = None
+        self._version = None
+        self._checked_at = 0.0
+    
+    def all(self):
+        return list(self._load().values())
+    
+    def get(self, tag_id):
+        tag = self._load().get(tag_id)
+        if tag is None:
+            # Possibly created in another process since our last check
+            tag = self._load(force_check=True).get(tag_id)
+        return tag
+    
+    def version(self):
+        self._load()
+        return self._version
+    
+    def expire(self):
+        self._checked_at = 0.0
+    
+    def _load(self, force_check=False):
+        now = time.monotonic()
+        tags = self._tags
+        if tags is not None and not force_check and now - self._checked_at < settings.TAG_CATALOG_CHECK_INTERVAL:
+            return tags
+        
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            cache.add(VERSION_KEY, time.time_ns(), None)
+            version = cache.get(VERSION_KEY)
+        
+        with self._lock:
+            if self._tags is None or version != self._version:
+                # Version is read before the query, so a concurrent write
+                # leaves us one version behind rather than wrongly current
+                self._tags = {tag.id: tag for tag in IssueTag.objects.order_by('name')}
+                self._version = version
+            self._checked_at = now
+            return self._tags
+
+catalog = TagCatalog()
+
+def invalidate():
+    def bump():
+        cache.set(VERSION_KEY, time.time_ns(), None)
+        catalog.expire()
+    transaction.on_commit(bump)
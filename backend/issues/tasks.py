@@ -1,25 +1,111 @@
+from collections import defaultdict
 from celery import shared_task
-from django.core.mail import send_mail
 from django.conf import settings
-from .models import Issue
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from .models import Issue, IssueNotification
+from . import archive
+from users.models import User
+from core import ratelimit
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
-@shared_task
-def send_issue_notification(issue_id, action):
+RETRY_POLICY = {
+    'autoretry_for': (DatabaseError,),
+    'retry_backoff': True,
+    'retry_backoff_max': 300,
+    'retry_jitter': True,
+    'max_retries': 5,
+}
+
+def notify_on_commit(issue, action):
+    """Publish a notification task once the surrounding transaction commits"""
+    if ratelimit.queue_depth('notifications') >= settings.NOTIFICATION_QUEUE_MAX:
+        # Workers are far behind; shed rather than grow the backlog further
+        logger.warning(f'Shedding {action} notification for issue {issue.id}')
+        return
+    # Keyed on the change being published, so redeliveries dedupe while two
+    # quick successive changes still notify twice
+    idempotency_key = f'{issue.id}:{action}:{issue.updated_at.isoformat()}'
+    issue_id, status = issue.id, issue.status
+    transaction.on_commit(lambda: send_issue_notification.delay(issue_id, action, idempotency_key, status))
+
+def _recipients(issue, action):
+    if action == 'created':
+        return list(
+            User.objects.filter(
+                role__in=[User.MAINTAINER, User.ADMIN], is_active=True
+            ).values_list('id', flat=True)
+        )
+    return [user_id for user_id in {issue.reporter_id, issue.assignee_id} if user_id]
+
+@shared_task(**RETRY_POLICY)
+def send_issue_notification(issue_id, action, idempotency_key=None, status=None):
+    """Queue per-recipient notifications; they are delivered as digests"""
     try:
-        issue = Issue.objects.get(id=issue_id)
+        issue = Issue.objects.only('id', 'status', 'reporter_id', 'assignee_id').get(id=issue_id)
+    except Issue.DoesNotExist:
+        logger.error(f'Issue with id {issue_id} not found')
+        return 0
+    
+    if idempotency_key is None:
+        # Published without a key (e.g. by hand); treat as a distinct change
+        idempotency_key = f'{issue.id}:{action}:{uuid.uuid4()}'
+    if status is None:
+        status = issue.status
+    
+    notifications = [
+        IssueNotification(
+            issue_id=issue.id,
+            recipient_id=recipient_id,
+            action=action,
+            status=status,
+            idempotency_key=idempotency_key,
+        )
+        for recipient_id in _recipients(issue, action)
+    ]
+    IssueNotification.objects.bulk_create(notifications, ignore_conflicts=True)
+    return len(notifications)
+
+def _describe(notification):
+    issue = notification.issue
+    if notification.action == 'created':
+        return f'New issue created: {issue.title}'
+    return f'Issue status changed: {issue.title} is now {notification.get_status_display()}'
+
+@shared_task(**RETRY_POLICY)
+def send_notification_digests():
+    """Deliver pending notifications as one digest per recipient"""
+    with transaction.atomic():
+        pending = list(
+            IssueNotification.objects.filter(sent_at__isnull=True)
+            .select_related('issue', 'recipient')
+            .select_for_update(skip_locked=True, of=('self',))
+            .order_by('created_at')[:settings.NOTIFICATION_DIGEST_BATCH_SIZE]
+        )
         
-        if action == 'created':
-            subject = f'New Issue Created: {issue.title}'
-            message = f'A new issue has been created by {issue.reporter.email}'
-        elif action == 'status_changed':
-            subject = f'Issue Status Changed: {issue.title}'
-            message = f'Issue status changed to {issue.get_status_display()}'
+        digests = defaultdict(list)
+        for notification in pending:
+            digests[notification.recipient_id].append(notification)
         
-        # In a real application, you would send emails to relevant users
-        logger.info(f'Notification: {subject} - {message}')
+        for notifications in digests.values():
+            recipient = notifications[0].recipient
+            subject = f'{len(notifications)} issue update(s)'
+            message = '\n'.join(_describe(notification) for notification in notifications)
+            # In a real application, you would email the digest to the recipient
+            logger.info(f'Digest for {recipient.email}: {subject} - {message}')
         
-    except Issue.DoesNotExist:
-        logger.error(f'Issue with id {issue_id} not found')
+        IssueNotification.objects.filter(
+            id__in=[notification.id for notification in pending]
+        ).update(sent_at=timezone.now())
+    
+    return len(digests)
+
+@shared_task(**RETRY_POLICY)
+def archive_done_issues():
+    """Move long-done issues, their comments and tag assignments to archive tables"""
+    archived = archive.archive_done_issues()
+    logger.info(f'Archived {archived} done issues')
+    return archived
@@ -4,7 +4,16 @@ from . import views
 urlpatterns = [
     path('', views.IssueListCreateView.as_view(), name='issue-list-create'),
     path('<int:pk>/', views.IssueDetailView.as_view(), name='issue-detail'),
+    path('activity/', views.GlobalActivityListView.as_view(), name='activity-list'),
+    path('queue/', views.IssueQueueView.as_view(), name='issue-queue'),
+    path('workload/', views.workload_overview, name='workload'),
+    path('archive/', views.ArchivedIssueListView.as_view(), name='archived-issue-list'),
+    path('archive/<int:pk>/', views.ArchivedIssueDetailView.as_view(), name='archived-issue-detail'),
+    path('views/', views.SavedViewListCreateView.as_view(), name='saved-view-list-create'),
+    path('views/<int:pk>/', views.SavedViewDetailView.as_view(), name='saved-view-detail'),
+    path('views/<int:pk>/results/', views.saved_view_results, name='saved-view-results'),
     path('tags/', views.IssueTagListCreateView.as_view(), name='tag-list-create'),
     path('<int:issue_id>/tags/<int:tag_id>/', views.assign_tag_to_issue, name='assign-tag'),
     path('<int:issue_id>/comments/', views.IssueCommentListCreateView.as_view(), name='issue-comments'),
+    path('<int:issue_id>/activity/', views.IssueActivityListView.as_view(), name='issue-activity'),
 ]
@@ -1,20 +1,39 @@
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
-from django.db.models import Q
-from .models import Issue, IssueTag, IssueComment
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from .models import (
+    Issue, IssueTag, IssueTagAssignment, IssueComment, IssueActivity,
+    SavedView, AssigneeLoad, ArchivedIssue
+)
 from .serializers import (
     IssueSerializer, IssueCreateSerializer, IssueTagSerializer, 
-    IssueCommentSerializer
+    IssueCommentSerializer, IssueActivitySerializer, SavedViewSerializer,
+    ArchivedIssueSerializer
 )
+from .pagination import ActivityCursorPagination, QueueCursorPagination
+from .filters import filter_issues, filter_by_tags
+from .tag_catalog import catalog
+from . import activity, http_cache, saved_views, workload
+from core.throttling import RoleScopedThrottle
 from core.permissions import (
     IsOwnerOrMaintainerOrAdmin, IsMaintainerOrAdmin, IsReporterForCreate
 )
 from users.models import User
-from .tasks import send_issue_notification
+from users.serializers import UserSerializer
+from .tasks import notify_on_commit
 
 class IssueListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsReporterForCreate]
+    throttle_classes = [RoleScopedThrottle]
+    throttle_scope = 'issue_write'
+    ORDERING_FIELDS = ['created_at', 'last_activity_at', 'comment_count']
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -22,81 +41,290 @@ class IssueListCreateView(generics.ListCreateAPIView):
         return IssueSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        queryset = Issue.objects.all()
+        queryset = filter_issues(Issue.objects.all(), self.request.user, self.request.query_params)
+        queryset = queryset.select_related('reporter', 'assignee').prefetch_related(
+            'tag_assignments__assigned_by', 'comments__author'
+        )
         
-        # Filter based on user role
-        if user.role == User.REPORTER:
-            queryset = queryset.filter(reporter=user)
+        tags = self.request.query_params.get('tags')
+        if tags:
+            try:
+                tag_ids = [int(tag_id) for tag_id in tags.split(',') if tag_id]
+            except ValueError:
+                raise ValidationError({'tags': 'Expected a comma-separated list of tag ids.'})
+            match = self.request.query_params.get('tag_match', 'any')
+            if match not in ('any', 'all'):
+                raise ValidationError({'tag_match': 'Must be one of any, all.'})
+            queryset = filter_by_tags(queryset, tag_ids, match)
         
-        # Apply filters
-        status_filter = self.request.query_params.get('status')
-        severity_filter = self.request.query_params.get('severity')
-        search = self.request.query_params.get('search')
+        active_since = self.request.query_params.get('active_since')
+        if active_since:
+            since = parse_datetime(active_since)
+            if since is None:
+                raise ValidationError({'active_since': 'Expected an ISO 8601 datetime.'})
+            queryset = queryset.filter(last_activity_at__gte=since)
         
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-        if severity_filter:
-            queryset = queryset.filter(severity=severity_filter)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+        ordering = self.request.query_params.get('ordering')
+        if ordering:
+            if ordering.lstrip('-') not in self.ORDERING_FIELDS:
+                raise ValidationError({'ordering': f'Must be one of {", ".join(self.ORDERING_FIELDS)}.'})
+            queryset = queryset.order_by(ordering, '-id')
         
         return queryset
     
     def perform_create(self, serializer):
-        issue = serializer.save()
-        # Send notification asynchronously
-        send_issue_notification.delay(issue.id, 'created')
+        with transaction.atomic():
+            extra = {}
+            if self._auto_assign():
+                severity = serializer.validated_data.get('severity', Issue._meta.get_field('severity').default)
+                extra['assignee_id'] = workload.pick_assignee(severity)
+            issue = serializer.save(**extra)
+        activity.record(issue.id, self.request.user, IssueActivity.ISSUE_CREATED)
+        # Send notification asynchronously once the issue is committed
+        notify_on_commit(issue, 'created')
+    
+    def _auto_assign(self):
+        value = self.request.data.get('auto_assign')
+        if value is None:
+            return settings.ISSUE_AUTO_ASSIGN
+        return str(value).lower() in ('1', 'true', 'yes')
 
 class IssueDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Issue.objects.all()
+    queryset = Issue.objects.select_related('reporter', 'assignee').prefetch_related(
+        'tag_assignments__assigned_by', 'comments__author'
+    )
     serializer_class = IssueSerializer
     permission_classes = [IsOwnerOrMaintainerOrAdmin]
     
+    def retrieve(self, request, *args, **kwargs):
+        issue_id = kwargs['pk']
+        version = http_cache.get_version(issue_id)
+        if version is None:
+            raise NotFound()
+        
+        validators = http_cache.Validators(request, issue_id, 'detail', version)
+        entry = validators.get()
+        if entry is None:
+            issue = self.get_object()
+            entry = {'reporter_id': issue.reporter_id, 'data': self.get_serializer(issue).data}
+            validators.set(entry)
+        else:
+            # The permission only needs the reporter; avoid loading the row
+            self.check_object_permissions(request, Issue(id=issue_id, reporter_id=entry['reporter_id']))
+        
+        response = validators.not_modified(request) or Response(entry['data'])
+        return validators.decorate(response)
+    
     def perform_update(self, serializer):
-        old_status = self.get_object().status
+        # serializer.instance was already loaded by update(); no second fetch
+        old = activity.snapshot(serializer.instance)
         issue = serializer.save()
+        changes = activity.diff(old, activity.snapshot(issue))
+        if changes:
+            activity.record(issue.id, self.request.user, IssueActivity.ISSUE_UPDATED, changes)
         
         # Send notification if status changed
-        if old_status != issue.status:
-            send_issue_notification.delay(issue.id, 'status_changed')
+        if 'status' in changes:
+            notify_on_commit(issue, 'status_changed')
 
 class IssueTagListCreateView(generics.ListCreateAPIView):
     queryset = IssueTag.objects.all()
     serializer_class = IssueTagSerializer
     permission_classes = [IsMaintainerOrAdmin]
+    
+    def list(self, request, *args, **kwargs):
+        # Served from the in-process catalog; no query per request
+        page = self.paginate_queryset(catalog.all())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 @api_view(['POST'])
 @permission_classes([IsMaintainerOrAdmin])
 def assign_tag_to_issue(request, issue_id, tag_id):
-    try:
-        issue = Issue.objects.get(id=issue_id)
-        tag = IssueTag.objects.get(id=tag_id)
-        
-        assignment, created = issue.tag_assignments.get_or_create(
-            tag=tag,
-            defaults={'assigned_by': request.user}
-        )
-        
-        if created:
-            return Response({'message': 'Tag assigned successfully'})
-        else:
-            return Response({'message': 'Tag already assigned'}, status=400)
-    
-    except (Issue.DoesNotExist, IssueTag.DoesNotExist):
+    tag = catalog.get(tag_id)
+    if tag is None or not Issue.objects.filter(id=issue_id).exists():
         return Response({'error': 'Issue or tag not found'}, status=404)
+    
+    assignment, created = IssueTagAssignment.objects.get_or_create(
+        issue_id=issue_id,
+        tag_id=tag.id,
+        defaults={'assigned_by': request.user}
+    )
+    
+    if created:
+        activity.record(issue_id, request.user, IssueActivity.TAG_ASSIGNED, {'tag': [None, tag.name]})
+        return Response({'message': 'Tag assigned successfully'})
+    else:
+        return Response({'message': 'Tag already assigned'}, status=400)
 
 class IssueCommentListCreateView(generics.ListCreateAPIView):
     serializer_class = IssueCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [RoleScopedThrottle]
+    throttle_scope = 'comment_write'
     
     def get_queryset(self):
         issue_id = self.kwargs['issue_id']
-        return IssueComment.objects.filter(issue_id=issue_id)
+        return IssueComment.objects.filter(issue_id=issue_id).select_related('author')
+    
+    def list(self, request, *args, **kwargs):
+        version = http_cache.get_version(kwargs['issue_id'])
+        if version is None:
+            return super().list(request, *args, **kwargs)
+        
+        validators = http_cache.Validators(request, kwargs['issue_id'], 'comments', version)
+        not_modified = validators.not_modified(request)
+        if not_modified is not None:
+            return validators.decorate(not_modified)
+        
+        data = validators.get()
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            validators.set(data)
+        return validators.decorate(Response(data))
     
     def perform_create(self, serializer):
         issue_id = self.kwargs['issue_id']
         issue = Issue.objects.get(id=issue_id)
-        serializer.save(author=self.request.user, issue=issue)
+        comment = serializer.save(author=self.request.user, issue=issue)
+        activity.record(issue.id, self.request.user, IssueActivity.COMMENT_ADDED, {'comment_id': comment.id})
+
+class IssueActivityListView(generics.ListAPIView):
+    """Per-issue timeline, newest first"""
+    serializer_class = IssueActivitySerializer
+    pagination_class = ActivityCursorPagination
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        queryset = IssueActivity.objects.filter(
+            issue_id=self.kwargs['issue_id']
+        ).select_related('actor')
+        
+        if self.request.user.role == User.REPORTER:
+            # Ownership may live on the hot or the archive table
+            user = self.request.user
+            queryset = queryset.filter(
+                Exists(Issue.objects.filter(id=OuterRef('issue_id'), reporter=user))
+                | Exists(ArchivedIssue.objects.filter(id=OuterRef('issue_id'), reporter=user))
+            )
+        
+        return queryset
+
+class GlobalActivityListView(generics.ListAPIView):
+    """Timeline across all issues, newest first"""
+    queryset = IssueActivity.objects.select_related('actor')
+    serializer_class = IssueActivitySerializer
+    pagination_class = ActivityCursorPagination
+    permission_classes = [IsMaintainerOrAdmin]
+
+class SavedViewListCreateView(generics.ListCreateAPIView):
+    serializer_class = SavedViewSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        return SavedView.objects.filter(owner=self.request.user)
+    
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+
+class SavedViewDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = SavedViewSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        return SavedView.objects.filter(owner=self.request.user)
+    
+    def perform_update(self, serializer):
+        view = serializer.save()
+        saved_views.invalidate(view.id)
+    
+    def perform_destroy(self, instance):
+        saved_views.invalidate(instance.id)
+        instance.delete()
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def saved_view_results(request, pk):
+    """A page of a saved view's cached results, plus changes since ``?since=``"""
+    view = get_object_or_404(SavedView, pk=pk, owner=request.user)
+    entry = saved_views.get_results(view, request.user)
+    
+    try:
+        page = max(int(request.query_params.get('page', 1)), 1)
+    except ValueError:
+        raise ValidationError({'page': 'Expected an integer.'})
+    page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+    page_ids = saved_views.page_ids(entry, view, request.user, (page - 1) * page_size, page * page_size)
+    
+    issues = Issue.objects.filter(id__in=page_ids).select_related(
+        'reporter', 'assignee'
+    ).prefetch_related(
+        'tag_assignments__assigned_by', 'comments__author'
+    )
+    by_id = {issue.id: issue for issue in issues}
+    results = [by_id[issue_id] for issue_id in page_ids if issue_id in by_id]
+    
+    data = {
+        'count': entry['count'],
+        'computed_at': entry['computed_at'],
+        'results': IssueSerializer(results, many=True, context={'request': request}).data,
+    }
+    
+    since = request.query_params.get('since')
+    if since:
+        since_dt = parse_datetime(since)
+        if since_dt is None:
+            raise ValidationError({'since': 'Expected an ISO 8601 datetime.'})
+        if timezone.is_naive(since_dt):
+            since_dt = timezone.make_aware(since_dt)
+        data['changes'] = saved_views.changes_since(entry, since_dt)
+    
+    return Response(data)
+
+class IssueQueueView(generics.ListAPIView):
+    """Open issues assigned to the current user, newest first"""
+    serializer_class = IssueSerializer
+    pagination_class = QueueCursorPagination
+    permission_classes = [IsMaintainerOrAdmin]
+    
+    def get_queryset(self):
+        return Issue.objects.filter(
+            assignee=self.request.user
+        ).exclude(status='done').select_related('reporter', 'assignee').prefetch_related(
+            'tag_assignments__assigned_by', 'comments__author'
+        )
+    
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data['load'] = workload.load_for(request.user)
+        return response
+
+@api_view(['GET'])
+@permission_classes([IsMaintainerOrAdmin])
+def workload_overview(request):
+    loads = {}
+    for load in AssigneeLoad.objects.select_related('assignee').order_by('assignee_id'):
+        entry = loads.setdefault(load.assignee_id, {
+            'assignee': UserSerializer(load.assignee).data,
+            'load': {severity: 0 for severity, _ in Issue.SEVERITY_CHOICES},
+        })
+        entry['load'][load.severity] = load.open_count
+    return Response(list(loads.values()))
+
+class ArchivedIssueListView(generics.ListAPIView):
+    """Archived issues, filtered like the live issue list"""
+    serializer_class = ArchivedIssueSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        queryset = ArchivedIssue.objects.select_related('reporter', 'assignee').prefetch_related(
+            'tag_assignments__assigned_by', 'comments__author'
+        )
+        return filter_issues(queryset, self.request.user, self.request.query_params)
+
+class ArchivedIssueDetailView(generics.RetrieveAPIView):
+    queryset = ArchivedIssue.objects.select_related('reporter', 'assignee').prefetch_related(
+        'tag_assignments__assigned_by', 'comments__author'
+    )
+    serializer_class = ArchivedIssueSerializer
+    permission_classes = [IsOwnerOrMaintainerOrAdmin]
@@ -0,0 +1,77 @@
+from django.db.models import F
+from .models import Issue, AssigneeLoad
+from users.models import User
+
+def _bucket(assignee_id, severity, status):
+    if assignee_id is None or status == 'done':
+        return None
+    return assignee_id, severity
+
+def _adjust(bucket, delta):
+    assignee_id, severity = bucket
+    counters = AssigneeLoad.objects.filter(assignee_id=assignee_id, severity=severity)
+    if counters.update(open_count=F('open_count') + delta):
+        return
+    load, created = AssigneeLoad.objects.get_or_create(
+        assignee_id=assignee_id, severity=severity, defaults={'open_count': max(delta, 0)}
+    )
+    if not created:
+        counters.update(open_count=F('open_count') + delta)
+
+def issue_written(issue, created=False, deleted=False):
+    """Move ``issue`` between load buckets according to what changed"""
+    loaded = getattr(issue, '_loaded_values', {})
+    current = _bucket(issue.assignee_id, issue.severity, issue.status)
+    
+    if created:
+        old, new = None, current
+    elif all(field in loaded for field in ('assignee_id', 'severity', 'status')):
+        old = _bucket(loaded['assignee_id'], loaded['severity'], loaded['status'])
+        new = None if deleted else current
+    elif deleted:
+        old, new = current, None
+    else:
+        # Partially loaded instance; repair_issue_counters reconciles
+        return
+    
+    if old == new:
+        return
+    if old is not None:
+        _adjust(old, -1)
+    if new is not None:
+        _adjust(new, 1)
+
+def ensure_counters(user):
+    """Give a maintainer a zero row per severity so auto-assign can pick them"""
+    if user.role != User.MAINTAINER:
+        return
+    AssigneeLoad.objects.bulk_create(
+        [AssigneeLoad(assignee=user, severity=severity) for severity, _ in Issue.SEVERITY_CHOICES],
+        ignore_conflicts=True,
+    )
+
+def pick_assignee(severity):
+    """
+    Return the id of the active maintainer with the fewest open issues of
+    ``severity``. Must run inside the transaction that saves the issue: the
+    chosen counter row stays locked until commit, and SKIP LOCKED makes
+    concurrent creators move on to the next least-loaded maintainer
+    instead of queueing behind it.
+    """
+    candidates = AssigneeLoad.objects.filter(
+        severity=severity,
+        assignee__role=User.MAINTAINER,
+        assignee__is_active=True,
+    ).order_by('open_count', 'assignee_id')
+    
+    assignee_id = candidates.select_for_update(
+        skip_locked=True, of=('self',)
+    ).values_list('assignee_id', flat=True).first()
+    if assignee_id is None:
+        # Every counter row is locked by a concurrent create; share the least loaded
+        assignee_id = candidates.values_list('assignee_id', flat=True).first()
+    return assignee_id
+
+def load_for(user):
+    loads = AssigneeLoad.objects.filter(assignee=user).values_list('severity', 'open_count')
+    return {severity: 0 for severity, _ in Issue.SEVERITY_CHOICES} | dict(loads)
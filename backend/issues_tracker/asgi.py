@@ -2,12 +2,16 @@ import os
 from django.core.asgi import get_asgi_application
 from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
-from issues.routing import websocket_urlpatterns
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'issues_tracker.settings')
 
+# Sets Django up; consumers import models, so routing must come after it
+django_asgi_app = get_asgi_application()
+
+from issues.routing import websocket_urlpatterns  # noqa: E402
+
 application = ProtocolTypeRouter({
-    "http": get_asgi_application(),
+    "http": django_asgi_app,
     "websocket": AuthMiddlewareStack(
         URLRouter(
             websocket_urlpatterns
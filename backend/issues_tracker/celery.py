@@ -14,4 +14,12 @@ app.conf.beat_schedule = {
         'task': 'analytics.tasks.aggregate_daily_stats',
         'schedule': crontab(minute='*/30'),  # Every 30 minutes
     },
+    'send-notification-digests': {
+        'task': 'issues.tasks.send_notification_digests',
+        'schedule': crontab(minute='*'),  # Every minute
+    },
+    'archive-done-issues': {
+        'task': 'issues.tasks.archive_done_issues',
+        'schedule': crontab(hour=3, minute=0),  # Daily at 03:00
+    },
 }
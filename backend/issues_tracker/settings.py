@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -13,6 +13,8 @@ DEBUG = config('DEBUG', default=False, cast=bool)
 
 ALLOWED_HOSTS = ['*']
 
+API_DOCS_ENABLED = config('API_DOCS_ENABLED', default=True, cast=bool)
+
 # Application definition
 DJANGO_APPS = [
     'daphne',
@@ -55,6 +57,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'allauth.account.middleware.AccountMiddleware',
 ]
 
 ROOT_URLCONF = 'issues_tracker.urls'
@@ -90,6 +93,49 @@ DATABASES = {
     }
 }
 
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': config('CACHE_URL', default=config('REDIS_URL', default='redis://localhost:6379/0')),
+        'KEY_PREFIX': 'issues_tracker',
+    }
+}
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Authentication
+# ModelBackend stays listed so sessions created before the cached backend
+# (which store its path in BACKEND_SESSION_KEY) remain logged in
+AUTHENTICATION_BACKENDS = [
+    'core.backends.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# Short TTLs; explicit invalidation happens in core.signals
+AUTH_USER_CACHE_TIMEOUT = config('AUTH_USER_CACHE_TIMEOUT', default=60, cast=int)
+AUTH_TOKEN_CACHE_TIMEOUT = config('AUTH_TOKEN_CACHE_TIMEOUT', default=60, cast=int)
+
+# Saved issue views
+SAVED_VIEW_CACHE_TIMEOUT = config('SAVED_VIEW_CACHE_TIMEOUT', default=3600, cast=int)
+SAVED_VIEW_MAX_RESULTS = config('SAVED_VIEW_MAX_RESULTS', default=1000, cast=int)
+
+# How often each process checks whether its tag catalog copy is stale
+TAG_CATALOG_CHECK_INTERVAL = config('TAG_CATALOG_CHECK_INTERVAL', default=2.0, cast=float)
+
+# Auto-assign new issues to the least-loaded maintainer unless the request
+# passes auto_assign explicitly
+ISSUE_AUTO_ASSIGN = config('ISSUE_AUTO_ASSIGN', default=False, cast=bool)
+
+# Lifetime of cached issue representations. Issue, comment, tag and user
+# writes move the version stamp, so this only bounds memory use
+ISSUE_REPRESENTATION_CACHE_TIMEOUT = config('ISSUE_REPRESENTATION_CACHE_TIMEOUT', default=300, cast=int)
+
+# Archival of done issues
+ARCHIVE_AFTER_DAYS = config('ARCHIVE_AFTER_DAYS', default=180, cast=int)
+ARCHIVE_BATCH_SIZE = config('ARCHIVE_BATCH_SIZE', default=500, cast=int)
+ARCHIVE_MAX_BATCHES = config('ARCHIVE_MAX_BATCHES', default=200, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -126,7 +172,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'oauth2_provider.contrib.rest_framework.OAuth2Authentication',
+        'core.authentication.CachedOAuth2Authentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -186,6 +232,18 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_ROUTES = {
+    'issues.tasks.archive_done_issues': {'queue': 'analytics'},
+    'issues.tasks.*': {'queue': 'notifications'},
+    'analytics.tasks.*': {'queue': 'analytics'},
+}
+# Tasks are idempotent, so redelivery after a worker crash is safe
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+
+# Notifications
+NOTIFICATION_DIGEST_BATCH_SIZE = config('NOTIFICATION_DIGEST_BATCH_SIZE', default=500, cast=int)
 
 # Channels
 CHANNEL_LAYERS = {
@@ -193,10 +251,34 @@ CHANNEL_LAYERS = {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
         'CONFIG': {
             "hosts": [config('REDIS_URL', default='redis://localhost:6379/0')],
+            # Per-channel backlog; further messages to a full channel are dropped
+            "capacity": 100,
+            "expiry": 10,
         },
     },
 }
 
+# Rate limiting: Redis token buckets, rates per user role ('*' is the fallback)
+RATE_LIMIT_REDIS_URL = config('RATE_LIMIT_REDIS_URL', default=config('REDIS_URL', default='redis://localhost:6379/0'))
+RATE_LIMITS = {
+    'issue_write': {'admin': '300/min', 'maintainer': '120/min', 'reporter': '20/min', '*': '10/min'},
+    'comment_write': {'admin': '300/min', 'maintainer': '120/min', 'reporter': '30/min', '*': '10/min'},
+    'websocket_connect': {'admin': '60/min', 'maintainer': '60/min', 'reporter': '20/min', '*': '30/min'},
+    # Global budget for issue broadcasts; updates beyond it are shed
+    'broadcast': {'*': '100/s'},
+}
+
+# Backpressure
+WEBSOCKET_MAX_CONNECTIONS = {'admin': 20, 'maintainer': 20, 'reporter': 10, 'anonymous': 50}
+WEBSOCKET_CONNECTION_TTL = 3600
+# Peers (addresses or CIDRs) whose X-Real-IP header is believed when keying
+# anonymous sockets; set to the nginx address. Empty trusts nobody
+TRUSTED_PROXIES = config('TRUSTED_PROXIES', default='', cast=Csv())
+# Consumers this far behind on broadcasts are disconnected and must resync
+WEBSOCKET_MAX_LAG = config('WEBSOCKET_MAX_LAG', default=5.0, cast=float)
+# Notification tasks are shed while the notifications queue is this deep
+NOTIFICATION_QUEUE_MAX = config('NOTIFICATION_QUEUE_MAX', default=10000, cast=int)
+
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
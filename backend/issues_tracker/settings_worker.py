@@ -0,0 +1,18 @@
+# Celery worker/beat profile: only the apps the tasks need. Skips admin,
+# allauth, oauth2_provider, channels/daphne and the HTTP middleware stack.
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'rest_framework',
+    'issues',
+    'users',
+    'analytics',
+]
+
+MIDDLEWARE = []
+
+AUTHENTICATION_BACKENDS = ['django.contrib.auth.backends.ModelBackend']
+
+ROOT_URLCONF = 'issues_tracker.urls_worker'
@@ -2,7 +2,6 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from rest_framework.documentation import include_docs_urls
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -11,8 +10,12 @@ urlpatterns = [
     path('api/users/', include('users.urls')),
     path('api/issues/', include('issues.urls')),
     path('api/analytics/', include('analytics.urls')),
-    path('api/docs/', include_docs_urls(title='Issues Tracker API')),
 ]
 
+# coreapi schema generation is the heaviest part of loading the URLconf
+if settings.API_DOCS_ENABLED:
+    from rest_framework.documentation import include_docs_urls
+    urlpatterns.append(path('api/docs/', include_docs_urls(title='Issues Tracker API')))
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
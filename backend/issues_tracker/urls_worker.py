@@ -0,0 +1,3 @@
+# Workers serve no HTTP; an empty URLconf keeps system checks from
+# importing admin, allauth and oauth2_provider URLs
+urlpatterns = []